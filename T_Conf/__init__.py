@@ -10,14 +10,17 @@ Submodules:
 - transfinite: Low-level transfinite mesh helpers.
 - mesh: Sweep-based volume construction for spherical meshes.
 - utils: Gmsh initialization and diagnostic tools.
+- jit_kernels: Numerical kernels, JIT-compiled when Numba is installed.
 """
 
 from .core_disk import Transfinite_Disk
 from .core_sphere import Transfinite_Sphere
 from .utils import ensure_gmsh_available
+from .jit_kernels import warmup
 
 __all__ = [
     "Transfinite_Disk",
     "Transfinite_Sphere",
     "ensure_gmsh_available",
+    "warmup",
 ]
@@ -1,8 +1,29 @@
 import argparse
+import contextlib
+import cProfile
+import pstats
 import gmsh
 from T_Conf import Transfinite_Disk, Transfinite_Sphere
 
 
+@contextlib.contextmanager
+def _profiled(enabled):
+    """Run the enclosed block under cProfile and print its top consumers."""
+    if not enabled:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        stats = pstats.Stats(profiler).sort_stats("cumulative")
+        stats.print_stats(30)
+        # Calls into the Gmsh API, as opposed to T-Conf's own Python code
+        stats.print_stats(r"gmsh\.py", 30)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="T-Conf: Symmetric transfinite mesh generator for disks and spheres using Gmsh"
@@ -19,6 +40,9 @@ def main():
     parser_disk.add_argument("--h_outer", type=float, default=0.5, help="Outer mesh size")
     parser_disk.add_argument("--sectors", type=int, default=4, help="Number of angular sectors")
     parser_disk.add_argument("--out", type=str, default="disk.msh", help="Output mesh file")
+    parser_disk.add_argument(
+        "--profile", action="store_true", help="Profile mesh generation and print top consumers"
+    )
 
     # Sphere command
     parser_sphere = subparsers.add_parser("sphere", help="Generate a transfinite 3D sphere mesh")
@@ -28,32 +52,37 @@ def main():
     parser_sphere.add_argument("--h_band", type=float, default=0.1, help="Band mesh size")
     parser_sphere.add_argument("--h_outer", type=float, default=0.1, help="Outer mesh size")
     parser_sphere.add_argument("--out", type=str, default="sphere.msh", help="Output mesh file")
+    parser_sphere.add_argument(
+        "--profile", action="store_true", help="Profile mesh generation and print top consumers"
+    )
 
     args = parser.parse_args()
 
     if args.command == "disk":
-        Transfinite_Disk(
-            a=args.a,
-            rInner=args.rInner,
-            rOuter=args.rOuter,
-            h_band=args.h_band,
-            h_outer=args.h_outer,
-            n_sectors=args.sectors,
-        )
-        gmsh.model.mesh.generate(2)
+        with _profiled(args.profile):
+            Transfinite_Disk(
+                a=args.a,
+                rInner=args.rInner,
+                rOuter=args.rOuter,
+                h_band=args.h_band,
+                h_outer=args.h_outer,
+                n_sectors=args.sectors,
+            )
+            gmsh.model.mesh.generate(2)
         gmsh.write(args.out)
         gmsh.finalize()
         print(f"Disk mesh written to {args.out}")
 
     elif args.command == "sphere":
-        Transfinite_Sphere(
-            a=args.a,
-            rInner=args.rInner,
-            rOuter=args.rOuter,
-            h_band=args.h_band,
-            h_outer=args.h_outer,
-        )
-        gmsh.model.mesh.generate(3)
+        with _profiled(args.profile):
+            Transfinite_Sphere(
+                a=args.a,
+                rInner=args.rInner,
+                rOuter=args.rOuter,
+                h_band=args.h_band,
+                h_outer=args.h_outer,
+            )
+            gmsh.model.mesh.generate(3)
         gmsh.write(args.out)
         gmsh.finalize()
         print(f"Sphere mesh written to {args.out}")
@@ -8,7 +8,7 @@ around radius rInner, and an outer annular bulk region.
 
 import math
 import gmsh
-from typing import List
+from typing import Dict, List, Tuple
 from T_Conf.utils import ensure_gmsh_available
 from T_Conf.transfinite import set_transfinite
 import numpy as np
@@ -32,7 +32,8 @@ def Transfinite_Disk(
     Raises
     ------
     ValueError
-        If `a` is too large (rInner - a < 0 or rInner + a > rOuter).
+        If `a` is too large (rInner - a < 0 or rInner + a > rOuter), or if
+        `n_sectors` is less than 3.
     """
     ensure_gmsh_available()
 
@@ -44,117 +45,164 @@ def Transfinite_Disk(
     except Exception:
         gmsh.model.add("TransfiniteDisk")
 
-    # Parameter checks
-    if rInner - a < 0:
+    # Parameter checks. When the band reaches the center (rInner == a up to
+    # rounding) the inner ring collapses onto the center point.
+    use_center = math.isclose(rInner, a)
+    if not use_center and rInner - a < 0:
         raise ValueError("rInner - a must be nonnegative.")
     if rInner + a > rOuter:
         raise ValueError("rInner + a must be <= rOuter.")
+    if n_sectors < 3:
+        # Gmsh circle arcs must span less than pi
+        raise ValueError("n_sectors must be at least 3.")
+
+    # Local aliases for the Gmsh calls made once per point, curve or surface
+    addPoint = gmsh.model.geo.addPoint
+    addLine = gmsh.model.geo.addLine
+    addCircleArc = gmsh.model.geo.addCircleArc
+    addCurveLoop = gmsh.model.geo.addCurveLoop
+    addPlaneSurface = gmsh.model.geo.addPlaneSurface
 
     # Transfinite parameters
     n_div_radial = max(4, int(np.ceil(2 * a / h_band)))
-    n_div_angular = max(4, int(math.ceil((0.5 * math.pi) / h_band)))
-
-    def meshSizeAt(x, y):
-        r = math.sqrt(x * x + y * y)
-        # if we’re in the band: fine
-        if rInner - a <= r <= rInner + a:
-            return h_band
-        # otherwise coarser
-        return h_outer
-
-    inner_surfaces: List[int] = []
-    outer_surfaces: List[int] = []
-    p_center = gmsh.model.geo.addPoint(0, 0, 0, meshSizeAt(0, 0))
-
-    # Helper to create a point
-    def make_pt(r, theta):
-        x, y = r * math.cos(theta), r * math.sin(theta)
-        return gmsh.model.geo.addPoint(x, y, 0, meshSizeAt(x, y))
-
-    n_sectors = 4
+    n_div_angular = max(4, int(math.ceil((2 * math.pi / n_sectors) / h_band)))
+
+    def meshSizeAt(r):
+        # fine inside the band, coarser everywhere else
+        return np.where((r >= rInner - a) & (r <= rInner + a), h_band, h_outer)
+
+    p_center = addPoint(0, 0, 0)
+    # Point tags grouped by mesh size, assigned in bulk once all points exist
+    by_size: Dict[float, List[Tuple[int, int]]] = {float(meshSizeAt(0.0)): [(0, p_center)]}
+
+    # At most two inner and two outer surfaces per sector
+    inner_surfaces = np.empty(2 * n_sectors, dtype=np.int32)
+    outer_surfaces = np.empty(2 * n_sectors, dtype=np.int32)
+    n_inner = n_outer = 0
+    theta = 2 * np.pi * np.arange(n_sectors) / n_sectors
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+
+    # Rings of points at key radii. Each angle is shared by two neighbouring
+    # sectors, so every point is created exactly once.
+    rings = {"mid": rInner, "out": rInner + a}
+    if not use_center:
+        rings["in"] = rInner - a
+    if a + rInner < rOuter:
+        rings["o2"] = rOuter
+
+    # Coordinate and size tables for all rings at once
+    radii = np.fromiter(rings.values(), dtype=float)
+    xs = np.outer(radii, cos_t)
+    ys = np.outer(radii, sin_t)
+    sizes = meshSizeAt(radii)
+
+    pts: Dict[Tuple[str, int], int] = {}
+    for k, name in enumerate(rings):
+        for j in range(n_sectors):
+            pts[(name, j)] = addPoint(xs[k, j], ys[k, j], 0)
+        by_size.setdefault(float(sizes[k]), []).extend(
+            (0, pts[(name, j)]) for j in range(n_sectors)
+        )
+    for size, dimTags in by_size.items():
+        gmsh.model.geo.mesh.setSize(dimTags, size)
+    for j in range(n_sectors):
+        pts[("c", j)] = p_center
+        if use_center:
+            pts[("in", j)] = p_center
+
+    # Radial lines are likewise shared between neighbouring sectors
+    lines: Dict[Tuple[str, str, int], int] = {}
+
+    def pt(name, j):
+        return pts[(name, j)]
+
+    def radial_line(start, end, j):
+        key = (start, end, j)
+        if key not in lines:
+            lines[key] = addLine(pt(start, j), pt(end, j))
+        return lines[key]
+
+    # Per-sector transfinite curves and band surfaces, applied after the loop
+    radial_all = np.empty((n_sectors, 4), dtype=np.int32)
+    circular_all = np.empty((n_sectors, 3 if use_center else 4), dtype=np.int32)
+    band_surfaces = np.empty((n_sectors, 2), dtype=np.int32)
+
     for i in range(n_sectors):
-        theta0 = 2 * math.pi * i / n_sectors
-        theta1 = 2 * math.pi * (i + 1) / n_sectors
-        # Points at key radii
-        p = {
-            "in0": make_pt(rInner - a, theta0),
-            "in1": make_pt(rInner - a, theta1),
-            "mid0": make_pt(rInner, theta0),
-            "mid1": make_pt(rInner, theta1),
-            "out0": make_pt(rInner + a, theta0),
-            "out1": make_pt(rInner + a, theta1),
-            "o20": make_pt(rOuter, theta0),
-            "o21": make_pt(rOuter, theta1),
-        }
+        j0, j1 = i, (i + 1) % n_sectors
+
+        # inner band, a triangle when the inner ring collapses onto the center
+        curves_ib = [
+            radial_line("in", "mid", j0),
+            addCircleArc(pt("mid", j0), p_center, pt("mid", j1)),
+            -radial_line("in", "mid", j1),
+        ]
+        if not use_center:
+            curves_ib.append(addCircleArc(pt("in", j1), p_center, pt("in", j0)))
+        arc_interface = curves_ib[1]
+        loop_ib = addCurveLoop(curves_ib)
+        surf_ib = addPlaneSurface([loop_ib])
+        inner_surfaces[n_inner] = surf_ib
+        n_inner += 1
 
         # inner bulk
-        if rInner - a > 0:
-            # inner band
-            curves_ib = [
-                gmsh.model.geo.addLine(p["in0"], p["mid0"]),
-                gmsh.model.geo.addCircleArc(p["mid0"], p_center, p["mid1"]),
-                gmsh.model.geo.addLine(p["mid1"], p["in1"]),
-                gmsh.model.geo.addCircleArc(p["in1"], p_center, p["in0"]),
-            ]
-            arc_interface = curves_ib[1]
-            loop_ib = gmsh.model.geo.addCurveLoop(curves_ib)
-            surf_ib = gmsh.model.geo.addPlaneSurface([loop_ib])
-            inner_surfaces.append(surf_ib)
+        if not use_center:
             inner_arc = curves_ib[3]
-            loop = gmsh.model.geo.addCurveLoop(
+            loop = addCurveLoop(
                 [
-                    gmsh.model.geo.addLine(p_center, p["in0"]),
+                    radial_line("c", "in", j0),
                     -inner_arc,
-                    gmsh.model.geo.addLine(p["in1"], p_center),
+                    -radial_line("c", "in", j1),
                 ]
             )
-            inner_surfaces.append(gmsh.model.geo.addPlaneSurface([loop]))
-        elif rInner == a:
-            curves_ib = [
-                gmsh.model.geo.addLine(p_center, p["mid0"]),
-                gmsh.model.geo.addCircleArc(p["mid0"], p_center, p["mid1"]),
-                gmsh.model.geo.addLine(p["mid1"], p_center),
-            ]
-            arc_interface = curves_ib[1]
-            loop_ib = gmsh.model.geo.addCurveLoop(curves_ib)
-            surf_ib = gmsh.model.geo.addPlaneSurface([loop_ib])
-            inner_surfaces.append(surf_ib)
+            inner_surfaces[n_inner] = addPlaneSurface([loop])
+            n_inner += 1
 
         # outer band
         curves_ob = [
-            gmsh.model.geo.addLine(p["mid0"], p["out0"]),
-            gmsh.model.geo.addCircleArc(p["out0"], p_center, p["out1"]),
-            gmsh.model.geo.addLine(p["out1"], p["mid1"]),
+            radial_line("mid", "out", j0),
+            addCircleArc(pt("out", j0), p_center, pt("out", j1)),
+            -radial_line("mid", "out", j1),
             -arc_interface,
         ]
         arc_outer = curves_ob[1]
-        loop_ob = gmsh.model.geo.addCurveLoop(curves_ob)
-        surf_ob = gmsh.model.geo.addPlaneSurface([loop_ob])
-        outer_surfaces.append(surf_ob)
+        loop_ob = addCurveLoop(curves_ob)
+        surf_ob = addPlaneSurface([loop_ob])
+        outer_surfaces[n_outer] = surf_ob
+        n_outer += 1
         if a + rInner < rOuter:
             # outer bulk
-            l_b0 = gmsh.model.geo.addLine(p["out0"], p["o20"])
-            arc_bound = gmsh.model.geo.addCircleArc(p["o20"], p_center, p["o21"])
-            l_b1 = gmsh.model.geo.addLine(p["o21"], p["out1"])
+            l_b0 = radial_line("out", "o2", j0)
+            arc_bound = addCircleArc(pt("o2", j0), p_center, pt("o2", j1))
+            l_b1 = -radial_line("out", "o2", j1)
 
             # Reuse the exact interface arc
-            loop_bulk = gmsh.model.geo.addCurveLoop([l_b0, arc_bound, l_b1, -arc_outer])
-            outer_surfaces.append(gmsh.model.geo.addPlaneSurface([loop_bulk]))
-
-        set_transfinite(
-            radial_curves=[curves_ib[0], curves_ib[2], curves_ob[0], curves_ob[2]],
-            circular_curves=[curves_ib[1], curves_ib[3], curves_ob[1], curves_ob[3]],
-            surfaces=[(surf_ib, "Right"), (surf_ob, "Left")],
-            n_div_radial=n_div_radial,
-            n_div_circular=n_div_angular,
-        )
+            loop_bulk = addCurveLoop([l_b0, arc_bound, l_b1, -arc_outer])
+            outer_surfaces[n_outer] = addPlaneSurface([loop_bulk])
+            n_outer += 1
+
+        radial_all[i] = [curves_ib[0], curves_ib[2], curves_ob[0], curves_ob[2]]
+        circular_all[i] = curves_ib[1::2] + curves_ob[1::2]
+        band_surfaces[i] = [surf_ib, surf_ob]
+
+    set_transfinite(
+        radial_curves=radial_all.ravel().tolist(),
+        circular_curves=circular_all.ravel().tolist(),
+        surfaces=[
+            (surf, arrangement)
+            for row in band_surfaces.tolist()
+            for surf, arrangement in zip(row, ("Right", "Left"))
+        ],
+        n_div_radial=n_div_radial,
+        n_div_circular=n_div_angular,
+    )
 
     # Tagging physical groups
 
-    innerGroupTag = gmsh.model.addPhysicalGroup(2, inner_surfaces)
+    innerGroupTag = gmsh.model.addPhysicalGroup(2, inner_surfaces[:n_inner].tolist())
     gmsh.model.setPhysicalName(2, innerGroupTag, InnerMaterialName)
 
-    outerGroupTag = gmsh.model.addPhysicalGroup(2, outer_surfaces)
+    outerGroupTag = gmsh.model.addPhysicalGroup(2, outer_surfaces[:n_outer].tolist())
     gmsh.model.setPhysicalName(2, outerGroupTag, OuterMaterialName)
 
     # Final sync
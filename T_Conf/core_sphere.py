@@ -11,8 +11,8 @@ import math
 import numpy as np
 
 from T_Conf.utils import ensure_gmsh_available
-from T_Conf.Sphere.transfinite import set_transfinite
-from T_Conf.Sphere.mesh import create_wedge_volumes
+from T_Conf.transfinite import set_transfinite
+from T_Conf.mesh import create_wedge_volumes, track_curve
 
 
 def Transfinite_Sphere(
@@ -108,6 +108,16 @@ def Transfinite_Sphere(
         # otherwise coarser
         return h_outer
 
+    # Types of the profile curves, so the swept surfaces can be classified
+    # without querying Gmsh for every curve they share with the profile.
+    curve_ranges = []
+
+    def add_arc(start, center, end):
+        return track_curve(curve_ranges, gmsh.model.geo.addCircleArc(start, center, end), "Circle")
+
+    def add_line(start, end):
+        return track_curve(curve_ranges, gmsh.model.geo.addLine(start, end), "Line")
+
     # Define common points
     p0 = gmsh.model.geo.addPoint(0, 0, 0, meshSizeAt(0, 0, 0))
     p1 = gmsh.model.geo.addPoint(rInner - a, 0, 0, meshSizeAt(rInner - a, 0, 0))
@@ -133,16 +143,16 @@ def Transfinite_Sphere(
 
     # ------------------ Wedge 1 (first octant) ------------------
     # Outer band surface.
-    arcOuterUp1 = gmsh.model.geo.addCircleArc(p2, p0, p4)
-    arcInterface1 = gmsh.model.geo.addCircleArc(p5, p0, p6)
-    lOutUp1a = gmsh.model.geo.addLine(p5, p2)
-    lOutUp1b = gmsh.model.geo.addLine(p4, p6)
+    arcOuterUp1 = add_arc(p2, p0, p4)
+    arcInterface1 = add_arc(p5, p0, p6)
+    lOutUp1a = add_line(p5, p2)
+    lOutUp1b = add_line(p4, p6)
     outerLoopUp1 = gmsh.model.geo.addCurveLoop([-lOutUp1b, -arcOuterUp1, -lOutUp1a, arcInterface1])
     outerSurfUp1 = gmsh.model.geo.addPlaneSurface([outerLoopUp1])
 
     if a == rInner:
-        lInUp1a = gmsh.model.geo.addLine(p0, p5)
-        lInUp1b = gmsh.model.geo.addLine(p6, p0)
+        lInUp1a = add_line(p0, p5)
+        lInUp1b = add_line(p6, p0)
         innerLoopUp1 = gmsh.model.geo.addCurveLoop([lInUp1a, arcInterface1, lInUp1b])
         innerSurfUp1 = gmsh.model.geo.addPlaneSurface([innerLoopUp1])
         innerBulkSurf1 = None
@@ -156,9 +166,9 @@ def Transfinite_Sphere(
             Bumpcoef,
         )
     else:
-        arcInnerUp1 = gmsh.model.geo.addCircleArc(p1, p0, p3)
-        lInUp1a = gmsh.model.geo.addLine(p1, p5)
-        lInUp1b = gmsh.model.geo.addLine(p6, p3)
+        arcInnerUp1 = add_arc(p1, p0, p3)
+        lInUp1a = add_line(p1, p5)
+        lInUp1b = add_line(p6, p3)
         innerLoopUp1 = gmsh.model.geo.addCurveLoop(
             [-lInUp1a, -arcInterface1, -lInUp1b, arcInnerUp1]
         )
@@ -171,8 +181,8 @@ def Transfinite_Sphere(
             nDiv_curved,
             Bumpcoef,
         )
-        lInBulk1a = gmsh.model.geo.addLine(p0, p1)
-        lInBulk1b = gmsh.model.geo.addLine(p3, p0)
+        lInBulk1a = add_line(p0, p1)
+        lInBulk1b = add_line(p3, p0)
         innerBulkLoop1 = gmsh.model.geo.addCurveLoop([lInBulk1a, arcInnerUp1, lInBulk1b])
         innerBulkSurf1 = gmsh.model.geo.addPlaneSurface([innerBulkLoop1])
 
@@ -180,15 +190,14 @@ def Transfinite_Sphere(
     if a + rInner == rOuter:
         outerBulkSurf1 = None
     else:
-        arcOuterBulk1 = gmsh.model.geo.addCircleArc(p7, p0, p8)
-        lOutBulk1a = gmsh.model.geo.addLine(p2, p7)
-        lOutBulk1b = gmsh.model.geo.addLine(p8, p4)
+        arcOuterBulk1 = add_arc(p7, p0, p8)
+        lOutBulk1a = add_line(p2, p7)
+        lOutBulk1b = add_line(p8, p4)
         outerBulkLoop1 = gmsh.model.geo.addCurveLoop(
             [-lOutBulk1b, -arcOuterBulk1, -lOutBulk1a, arcOuterUp1]
         )
         outerBulkSurf1 = gmsh.model.geo.addPlaneSurface([outerBulkLoop1])
 
-    gmsh.model.geo.synchronize()
     inner_vols1, outer_vols1 = create_wedge_volumes(
         innerSurfUp1,
         outerSurfUp1,
@@ -200,23 +209,24 @@ def Transfinite_Sphere(
         nDiv_radial,
         nDiv_curved,
         Bumpcoef,
+        curve_ranges,
     )
-    allInnerVols += [vol for vol in inner_vols1 if vol is not None]
-    allOuterVols += [vol for vol in outer_vols1 if vol is not None]
+    allInnerVols += inner_vols1[inner_vols1 > 0].tolist()
+    allOuterVols += outer_vols1[outer_vols1 > 0].tolist()
 
     # ------------------ Wedge 2 (lower, negative z quadrant) ------------------
-    arcOuterDown2 = gmsh.model.geo.addCircleArc(p2, p0, p4_down)
-    arcInterfaceDown2 = gmsh.model.geo.addCircleArc(p5, p0, p6_down)
-    lOutDown2a = gmsh.model.geo.addLine(p5, p2)
-    lOutDown2b = gmsh.model.geo.addLine(p4_down, p6_down)
+    arcOuterDown2 = add_arc(p2, p0, p4_down)
+    arcInterfaceDown2 = add_arc(p5, p0, p6_down)
+    lOutDown2a = add_line(p5, p2)
+    lOutDown2b = add_line(p4_down, p6_down)
     outerLoopDown2 = gmsh.model.geo.addCurveLoop(
         [lOutDown2a, arcOuterDown2, lOutDown2b, -arcInterfaceDown2]
     )
     outerSurfDown2 = gmsh.model.geo.addPlaneSurface([outerLoopDown2])
 
     if a == rInner:
-        lInDown2a = gmsh.model.geo.addLine(p0, p5)
-        lInDown2b = gmsh.model.geo.addLine(p6_down, p0)
+        lInDown2a = add_line(p0, p5)
+        lInDown2b = add_line(p6_down, p0)
         innerLoopDown2 = gmsh.model.geo.addCurveLoop([lInDown2a, arcInterfaceDown2, lInDown2b])
         innerSurfDown2 = gmsh.model.geo.addPlaneSurface([innerLoopDown2])
         innerBulkSurfDown2 = None
@@ -229,9 +239,9 @@ def Transfinite_Sphere(
             Bumpcoef,
         )
     else:
-        arcInnerDown2 = gmsh.model.geo.addCircleArc(p1, p0, p3_down)
-        lInDown2a = gmsh.model.geo.addLine(p1, p5)
-        lInDown2b = gmsh.model.geo.addLine(p6_down, p3_down)
+        arcInnerDown2 = add_arc(p1, p0, p3_down)
+        lInDown2a = add_line(p1, p5)
+        lInDown2b = add_line(p6_down, p3_down)
         innerLoopDown2 = gmsh.model.geo.addCurveLoop(
             [-lInDown2a, -arcInterfaceDown2, -lInDown2b, arcInnerDown2]
         )
@@ -244,8 +254,8 @@ def Transfinite_Sphere(
             nDiv_curved,
             Bumpcoef,
         )
-        lInBulkDown2a = gmsh.model.geo.addLine(p0, p1)
-        lInBulkDown2b = gmsh.model.geo.addLine(p3_down, p0)
+        lInBulkDown2a = add_line(p0, p1)
+        lInBulkDown2b = add_line(p3_down, p0)
         innerBulkLoopDown2 = gmsh.model.geo.addCurveLoop(
             [lInBulkDown2a, arcInnerDown2, lInBulkDown2b]
         )
@@ -255,15 +265,14 @@ def Transfinite_Sphere(
     if a + rInner == rOuter:
         outerBulkSurfDown2 = None
     else:
-        arcOuterBulkDown2 = gmsh.model.geo.addCircleArc(p7, p0, p8_down)
-        lOutBulkDown2a = gmsh.model.geo.addLine(p2, p7)
-        lOutBulkDown2b = gmsh.model.geo.addLine(p8_down, p4_down)
+        arcOuterBulkDown2 = add_arc(p7, p0, p8_down)
+        lOutBulkDown2a = add_line(p2, p7)
+        lOutBulkDown2b = add_line(p8_down, p4_down)
         outerBulkLoopDown2 = gmsh.model.geo.addCurveLoop(
             [-lOutBulkDown2b, -arcOuterBulkDown2, -lOutBulkDown2a, arcOuterDown2]
         )
         outerBulkSurfDown2 = gmsh.model.geo.addPlaneSurface([outerBulkLoopDown2])
 
-    gmsh.model.geo.synchronize()
     inner_vols2, outer_vols2 = create_wedge_volumes(
         innerSurfDown2,
         outerSurfDown2,
@@ -275,21 +284,22 @@ def Transfinite_Sphere(
         nDiv_radial,
         nDiv_curved,
         Bumpcoef,
+        curve_ranges,
     )
-    allInnerVols += [vol for vol in inner_vols2 if vol is not None]
-    allOuterVols += [vol for vol in outer_vols2 if vol is not None]
+    allInnerVols += inner_vols2[inner_vols2 > 0].tolist()
+    allOuterVols += outer_vols2[outer_vols2 > 0].tolist()
 
     # ------------------ Wedge 3 (negative x, positive z quadrant) ------------------
-    arcOuterUp3 = gmsh.model.geo.addCircleArc(p2_neg, p0, p4)
-    arcInterface3 = gmsh.model.geo.addCircleArc(p5_neg, p0, p6)
-    lOutUp3a = gmsh.model.geo.addLine(p5_neg, p2_neg)
-    lOutUp3b = gmsh.model.geo.addLine(p4, p6)
+    arcOuterUp3 = add_arc(p2_neg, p0, p4)
+    arcInterface3 = add_arc(p5_neg, p0, p6)
+    lOutUp3a = add_line(p5_neg, p2_neg)
+    lOutUp3b = add_line(p4, p6)
     outerLoopUp3 = gmsh.model.geo.addCurveLoop([lOutUp3a, arcOuterUp3, lOutUp3b, -arcInterface3])
     outerSurfUp3 = gmsh.model.geo.addPlaneSurface([outerLoopUp3])
 
     if a == rInner:
-        lInUp3a = gmsh.model.geo.addLine(p0, p5_neg)
-        lInUp3b = gmsh.model.geo.addLine(p6, p0)
+        lInUp3a = add_line(p0, p5_neg)
+        lInUp3b = add_line(p6, p0)
         innerLoopUp3 = gmsh.model.geo.addCurveLoop([lInUp3a, arcInterface3, lInUp3b])
         innerSurfUp3 = gmsh.model.geo.addPlaneSurface([innerLoopUp3])
         innerBulkSurf3 = None
@@ -302,9 +312,9 @@ def Transfinite_Sphere(
             Bumpcoef,
         )
     else:
-        arcInnerUp3 = gmsh.model.geo.addCircleArc(p1_neg, p0, p3)
-        lInUp3a = gmsh.model.geo.addLine(p1_neg, p5_neg)
-        lInUp3b = gmsh.model.geo.addLine(p6, p3)
+        arcInnerUp3 = add_arc(p1_neg, p0, p3)
+        lInUp3a = add_line(p1_neg, p5_neg)
+        lInUp3b = add_line(p6, p3)
         innerLoopUp3 = gmsh.model.geo.addCurveLoop(
             [-lInUp3a, -arcInterface3, -lInUp3b, arcInnerUp3]
         )
@@ -317,8 +327,8 @@ def Transfinite_Sphere(
             nDiv_curved,
             Bumpcoef,
         )
-        lInBulk3a = gmsh.model.geo.addLine(p0, p1_neg)
-        lInBulk3b = gmsh.model.geo.addLine(p3, p0)
+        lInBulk3a = add_line(p0, p1_neg)
+        lInBulk3b = add_line(p3, p0)
         innerBulkLoop3 = gmsh.model.geo.addCurveLoop([lInBulk3a, arcInnerUp3, lInBulk3b])
         innerBulkSurf3 = gmsh.model.geo.addPlaneSurface([innerBulkLoop3])
 
@@ -326,15 +336,14 @@ def Transfinite_Sphere(
     if a + rInner == rOuter:
         outerBulkSurf3 = None
     else:
-        arcOuterBulk3 = gmsh.model.geo.addCircleArc(p7_neg, p0, p8)
-        lOutBulk3a = gmsh.model.geo.addLine(p2_neg, p7_neg)
-        lOutBulk3b = gmsh.model.geo.addLine(p8, p4)
+        arcOuterBulk3 = add_arc(p7_neg, p0, p8)
+        lOutBulk3a = add_line(p2_neg, p7_neg)
+        lOutBulk3b = add_line(p8, p4)
         outerBulkLoop3 = gmsh.model.geo.addCurveLoop(
             [-lOutBulk3b, -arcOuterBulk3, -lOutBulk3a, arcOuterUp3]
         )
         outerBulkSurf3 = gmsh.model.geo.addPlaneSurface([outerBulkLoop3])
 
-    gmsh.model.geo.synchronize()
     inner_vols3, outer_vols3 = create_wedge_volumes(
         innerSurfUp3,
         outerSurfUp3,
@@ -346,23 +355,24 @@ def Transfinite_Sphere(
         nDiv_radial,
         nDiv_curved,
         Bumpcoef,
+        curve_ranges,
     )
-    allInnerVols += [vol for vol in inner_vols3 if vol is not None]
-    allOuterVols += [vol for vol in outer_vols3 if vol is not None]
+    allInnerVols += inner_vols3[inner_vols3 > 0].tolist()
+    allOuterVols += outer_vols3[outer_vols3 > 0].tolist()
 
     # ------------------ Wedge 4 (negative x, negative z quadrant) ------------------
-    arcOuterDown4 = gmsh.model.geo.addCircleArc(p2_neg, p0, p4_down)
-    arcInterfaceDown4 = gmsh.model.geo.addCircleArc(p5_neg, p0, p6_down)
-    lOutDown4a = gmsh.model.geo.addLine(p5_neg, p2_neg)
-    lOutDown4b = gmsh.model.geo.addLine(p4_down, p6_down)
+    arcOuterDown4 = add_arc(p2_neg, p0, p4_down)
+    arcInterfaceDown4 = add_arc(p5_neg, p0, p6_down)
+    lOutDown4a = add_line(p5_neg, p2_neg)
+    lOutDown4b = add_line(p4_down, p6_down)
     outerLoopDown4 = gmsh.model.geo.addCurveLoop(
         [lOutDown4a, arcOuterDown4, lOutDown4b, -arcInterfaceDown4]
     )
     outerSurfDown4 = gmsh.model.geo.addPlaneSurface([outerLoopDown4])
 
     if a == rInner:
-        lInDown4a = gmsh.model.geo.addLine(p0, p5_neg)
-        lInDown4b = gmsh.model.geo.addLine(p6_down, p0)
+        lInDown4a = add_line(p0, p5_neg)
+        lInDown4b = add_line(p6_down, p0)
         innerLoopDown4 = gmsh.model.geo.addCurveLoop([lInDown4a, arcInterfaceDown4, lInDown4b])
         innerSurfDown4 = gmsh.model.geo.addPlaneSurface([innerLoopDown4])
         innerBulkSurfDown4 = None
@@ -375,9 +385,9 @@ def Transfinite_Sphere(
             Bumpcoef,
         )
     else:
-        arcInnerDown4 = gmsh.model.geo.addCircleArc(p1_neg, p0, p3_down)
-        lInDown4a = gmsh.model.geo.addLine(p1_neg, p5_neg)
-        lInDown4b = gmsh.model.geo.addLine(p6_down, p3_down)
+        arcInnerDown4 = add_arc(p1_neg, p0, p3_down)
+        lInDown4a = add_line(p1_neg, p5_neg)
+        lInDown4b = add_line(p6_down, p3_down)
         innerLoopDown4 = gmsh.model.geo.addCurveLoop(
             [-lInDown4a, -arcInterfaceDown4, -lInDown4b, arcInnerDown4]
         )
@@ -390,8 +400,8 @@ def Transfinite_Sphere(
             nDiv_curved,
             Bumpcoef,
         )
-        lInBulkDown4a = gmsh.model.geo.addLine(p0, p1_neg)
-        lInBulkDown4b = gmsh.model.geo.addLine(p3_down, p0)
+        lInBulkDown4a = add_line(p0, p1_neg)
+        lInBulkDown4b = add_line(p3_down, p0)
         innerBulkLoopDown4 = gmsh.model.geo.addCurveLoop(
             [lInBulkDown4a, arcInnerDown4, lInBulkDown4b]
         )
@@ -401,15 +411,14 @@ def Transfinite_Sphere(
     if a + rInner == rOuter:
         outerBulkSurfDown4 = None
     else:
-        arcOuterBulkDown4 = gmsh.model.geo.addCircleArc(p7_neg, p0, p8_down)
-        lOutBulkDown4a = gmsh.model.geo.addLine(p2_neg, p7_neg)
-        lOutBulkDown4b = gmsh.model.geo.addLine(p8_down, p4_down)
+        arcOuterBulkDown4 = add_arc(p7_neg, p0, p8_down)
+        lOutBulkDown4a = add_line(p2_neg, p7_neg)
+        lOutBulkDown4b = add_line(p8_down, p4_down)
         outerBulkLoopDown4 = gmsh.model.geo.addCurveLoop(
             [-lOutBulkDown4b, -arcOuterBulkDown4, -lOutBulkDown4a, arcOuterDown4]
         )
         outerBulkSurfDown4 = gmsh.model.geo.addPlaneSurface([outerBulkLoopDown4])
 
-    gmsh.model.geo.synchronize()
     inner_vols4, outer_vols4 = create_wedge_volumes(
         innerSurfDown4,
         outerSurfDown4,
@@ -421,9 +430,10 @@ def Transfinite_Sphere(
         nDiv_radial,
         nDiv_curved,
         Bumpcoef,
+        curve_ranges,
     )
-    allInnerVols += [vol for vol in inner_vols4 if vol is not None]
-    allOuterVols += [vol for vol in outer_vols4 if vol is not None]
+    allInnerVols += inner_vols4[inner_vols4 > 0].tolist()
+    allOuterVols += outer_vols4[outer_vols4 > 0].tolist()
 
     # ------------------ Physical Groups and Interfaces ------------------
     innerGroupTag = gmsh.model.addPhysicalGroup(3, allInnerVols)
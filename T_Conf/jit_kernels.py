@@ -0,0 +1,65 @@
+"""
+T-Conf JIT Kernels
+
+Small numerical kernels used in hot paths of the meshing routines. They are
+compiled with Numba when it is installed (pip install T-Conf[jit]) and run as
+plain Python otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def classify_arrangements(bbox: np.ndarray, surface_type_is_inner: bool) -> np.ndarray:
+    """
+    Transfinite arrangement of swept surfaces from their bounding boxes.
+
+    Parameters
+    ----------
+    bbox : np.ndarray
+        (N, 6) array of (xmin, ymin, zmin, xmax, ymax, zmax) per surface.
+    surface_type_is_inner : bool
+        Inner surfaces always use the 'Right' arrangement.
+
+    Returns
+    -------
+    np.ndarray
+        0 ('Right') for inner surfaces and for outer surfaces lying in the
+        z = 0 plane at x >= 0, 1 ('Left') otherwise.
+    """
+    if surface_type_is_inner:
+        return np.zeros(bbox.shape[0], dtype=np.int64)
+    # Whole-array tests, so the decision is vectorized with or without Numba
+    tol = 1e-6
+    avg_z = (bbox[:, 2] + bbox[:, 5]) / 2.0
+    use_right = (np.abs(avg_z) < tol) & (bbox[:, 0] >= 0) & (bbox[:, 3] >= 0)
+    return (~use_right).astype(np.int64)
+
+
+def warmup() -> None:
+    """
+    Compile every kernel ahead of the first meshing call.
+
+    Each kernel is called once with arguments of the types used by the
+    meshing routines. With Numba installed the compiled code is also cached
+    on disk, so running this once after installation removes the compile
+    latency from later processes as well. Without Numba this does nothing
+    useful but is harmless.
+    """
+    classify_arrangements(np.zeros((1, 6)), False)
+
+
+__all__ = [
+    "classify_arrangements",
+    "warmup",
+]
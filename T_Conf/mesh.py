@@ -6,11 +6,16 @@ revolving surface curves and assembling wedge-shaped regions, faithfully
 replicating the logic in the original T_conf_sphere.py.
 """
 
-from typing import Sequence, Optional
+import bisect
+from typing import List, Sequence, Optional
 import gmsh
 import numpy as np
-from T_Conf.utils import ensure_gmsh_available, find_missing_numbers
+from T_Conf.utils import ensure_gmsh_available
 from T_Conf.transfinite import set_transfinite
+from T_Conf.jit_kernels import classify_arrangements
+
+# Arrangements indexed by the codes returned by classify_arrangements
+_ARRANGEMENTS = ("Right", "Left")
 
 
 def revolve_surface(
@@ -56,38 +61,150 @@ def revolve_surface(
     """
     ensure_gmsh_available()
 
-    # Positive sweep
-    out_plus = gmsh.model.geo.revolve(
-        [(2, surface_loop)],
-        revolve_axis[0],
-        revolve_axis[1],
-        revolve_axis[2],
-        revolve_center[0],
-        revolve_center[1],
-        revolve_center[2],
-        +angle_sweep,
-    )
-    vol_plus = next(v for (dim, v) in out_plus if dim == 3)
+    # Positive and negative sweeps
+    (out_plus,) = _revolve_batch([surface_loop], revolve_axis, revolve_center, +angle_sweep)
+    vol_plus = out_plus[1][1]
+    (out_minus,) = _revolve_batch([surface_loop], revolve_axis, revolve_center, -angle_sweep)
+    vol_minus = out_minus[1][1]
+
+    # Apply transfinite meshing on surfaces
+    if apply_transfinite:
+        gmsh.model.geo.synchronize()
+        _apply_transfinite_sweeps(
+            [(out_plus, surface_type), (out_minus, surface_type)],
+            n_div_radial,
+            n_div_curved,
+            bumpcoef,
+        )
+
+    return vol_plus, vol_minus
+
+
+def _revolve_batch(
+    surfaces: Sequence[int],
+    revolve_axis: Sequence[float],
+    revolve_center: Sequence[float],
+    angle: float,
+) -> List[list]:
+    """
+    Revolve several surfaces with a single Gmsh call and split the result.
 
-    # Negative sweep
-    out_minus = gmsh.model.geo.revolve(
-        [(2, surface_loop)],
+    For each input surface, in order, Gmsh returns its top surface and its
+    volume followed by the lateral surfaces, so every block starts one entry
+    before a volume and the volume of each block is always at index 1.
+
+    Returns
+    -------
+    List[list]
+        The revolve output of each surface, in the order of `surfaces`.
+    """
+    out = gmsh.model.geo.revolve(
+        [(2, s) for s in surfaces],
         revolve_axis[0],
         revolve_axis[1],
         revolve_axis[2],
         revolve_center[0],
         revolve_center[1],
         revolve_center[2],
-        -angle_sweep,
+        angle,
     )
-    vol_minus = next(v for (dim, v) in out_minus if dim == 3)
+    starts = [k - 1 for k, (dim, _) in enumerate(out) if dim == 3]
+    return [out[b:e] for b, e in zip(starts, starts[1:] + [len(out)])]
 
-    # Apply transfinite meshing on surfaces
-    if apply_transfinite:
-        _apply_transfinite_sweep(out_plus, n_div_radial, n_div_curved, bumpcoef, surface_type)
-        _apply_transfinite_sweep(out_minus, n_div_radial, n_div_curved, bumpcoef, surface_type)
 
-    return vol_plus, vol_minus
+def track_curve(curve_ranges: List[list], tag: int, etype: str) -> int:
+    """
+    Record the Gmsh type of a newly created curve in `curve_ranges`.
+
+    Curve tags are allocated in increasing order, so consecutive curves of the
+    same type are merged into [first, last, etype] ranges that
+    `_query_topology` can search by bisection instead of calling
+    gmsh.model.getType.
+
+    Returns
+    -------
+    int
+        `tag`, so that the call can wrap curve creation directly.
+    """
+    if curve_ranges and curve_ranges[-1][2] == etype and curve_ranges[-1][1] == tag - 1:
+        curve_ranges[-1][1] = tag
+    else:
+        curve_ranges.append([tag, tag, etype])
+    return tag
+
+
+def _apply_transfinite_sweeps(
+    sweeps: Sequence[tuple],
+    n_div_radial: int,
+    n_div_curved: int,
+    bumpcoef: float,
+    curve_ranges: Optional[Sequence[list]] = None,
+) -> None:
+    """
+    Apply transfinite mesh settings to a batch of (sweep_results, surface_type)
+    pairs. The model must be synchronized beforehand; the topology of all swept
+    surfaces is queried once for the whole batch.
+    """
+    new_surfs = [tag for (sweep_results, _) in sweeps for (dim, tag) in sweep_results if dim == 2]
+    topology = _query_topology(new_surfs, curve_ranges)
+    for sweep_results, surface_type in sweeps:
+        _apply_transfinite_sweep(
+            sweep_results, n_div_radial, n_div_curved, bumpcoef, surface_type, topology
+        )
+
+
+def _query_topology(
+    surf_tags: Sequence[int], curve_ranges: Optional[Sequence[list]] = None
+) -> tuple:
+    """
+    Batch the boundary queries needed by `_apply_transfinite_sweep`.
+
+    Curves falling in one of the `curve_ranges` recorded by `track_curve` are
+    classified without querying Gmsh.
+
+    Returns
+    -------
+    (surf_edges, edge_type, edge_endpoints) : tuple of dict
+        Oriented boundary curves of each surface, the Gmsh type of each curve
+        (keyed by absolute tag) and the endpoint tags of each oriented curve.
+    """
+    getBoundary = gmsh.model.getBoundary
+    getType = gmsh.model.getType
+
+    surf_edges = {}
+    for s_tag in surf_tags:
+        if s_tag not in surf_edges:
+            bnd = getBoundary([(2, s_tag)], combined=False, recursive=False)
+            surf_edges[s_tag] = [tag_c for (dim_c, tag_c) in bnd if dim_c == 1]
+
+    edges = list(dict.fromkeys(tag_c for tags in surf_edges.values() for tag_c in tags))
+    curve_ranges = curve_ranges or []
+    starts = [first for (first, _, _) in curve_ranges]
+    edge_type = {}
+    for tag_c in edges:
+        c = abs(tag_c)
+        if c in edge_type:
+            continue
+        k = bisect.bisect_right(starts, c) - 1
+        if k >= 0 and c <= curve_ranges[k][1]:
+            edge_type[c] = curve_ranges[k][2]
+        else:
+            edge_type[c] = getType(1, c)
+
+    # Lines and arcs have exactly two endpoints each, which lets a single
+    # uncombined query be split per curve; fall back to per-curve queries
+    # if any curve does not.
+    edge_endpoints = {}
+    endpts = getBoundary([(1, tag_c) for tag_c in edges], combined=False, recursive=False)
+    if len(endpts) == 2 * len(edges):
+        for k, tag_c in enumerate(edges):
+            edge_endpoints[tag_c] = [endpts[2 * k][1], endpts[2 * k + 1][1]]
+    else:
+        for tag_c in edges:
+            endpts = getBoundary([(1, tag_c)], combined=False, recursive=False)
+            edge_endpoints[tag_c] = [pt for (_, pt) in endpts]
+
+    return surf_edges, edge_type, edge_endpoints
 
 
 def _apply_transfinite_sweep(
@@ -96,66 +213,74 @@ def _apply_transfinite_sweep(
     n_div_curved: int,
     bumpcoef: float,
     surface_type: str,
+    topology: Optional[tuple] = None,
 ) -> None:
     """
     Internal helper to process newly created surfaces from a revolve sweep
     and apply transfinite mesh settings.
+
+    The model must be synchronized before calling. `topology` is the result
+    of `_query_topology` for (at least) the swept surfaces.
     """
     # Identify new surface tags
     new_surfs = [tag for (dim, tag) in sweep_results if dim == 2]
-    gmsh.model.geo.synchronize()
+    if topology is None:
+        topology = _query_topology(new_surfs)
+    surf_edges, edge_type, edge_endpoints = topology
 
-    for s_tag in new_surfs:
-        # Determine arrangement
-        if surface_type == "inner":
-            use_arr = "Right"
-        else:
-            bbox = gmsh.model.getBoundingBox(2, s_tag)
-            tol = 1e-6
-            avg_z = (bbox[2] + bbox[5]) / 2.0
-            use_arr = "Right" if (abs(avg_z) < tol and (bbox[0] >= 0 and bbox[3] >= 0)) else "Left"
+    # Determine arrangements; only outer surfaces need their bounding boxes
+    is_inner = surface_type == "inner"
+    bbox = np.zeros((len(new_surfs), 6))
+    if not is_inner:
+        getBoundingBox = gmsh.model.getBoundingBox
+        for k, s_tag in enumerate(new_surfs):
+            bbox[k] = getBoundingBox(2, s_tag)
+    arrangements = classify_arrangements(bbox, is_inner)
+
+    setTransfiniteSurface = gmsh.model.geo.mesh.setTransfiniteSurface
+
+    for s_tag, arr_code in zip(new_surfs, arrangements):
+        use_arr = _ARRANGEMENTS[arr_code]
 
         # Classify boundary edges
-        bnd = gmsh.model.getBoundary([(2, s_tag)], combined=False, recursive=False)
         corner_points = []
+        seen = set()
         radial_curves = []
         curved_curves = []
 
-        for dim_c, tag_c in bnd:
-            if dim_c == 1:
-                etype = gmsh.model.getType(1, abs(tag_c))
-                if etype == "Circle":
-                    curved_curves.append(tag_c)
-                elif etype == "Line":
-                    radial_curves.append(tag_c)
-                # Collect endpoints
-                endpts = gmsh.model.getBoundary([(1, tag_c)], combined=False, recursive=False)
-                if len(endpts) == 2:
-                    pt_a, pt_b = endpts[0][1], endpts[1][1]
-                    for pt in (pt_a, pt_b):
-                        if pt not in corner_points:
-                            corner_points.append(pt)
-
-        # Apply curve transfinite
-        set_transfinite(
-            radial_curves, curved_curves, [(s_tag, use_arr)], n_div_radial, n_div_curved, bumpcoef
-        )
+        for tag_c in surf_edges[s_tag]:
+            etype = edge_type[abs(tag_c)]
+            if etype == "Circle":
+                curved_curves.append(tag_c)
+            elif etype == "Line":
+                radial_curves.append(tag_c)
+            # Collect endpoints
+            endpts = edge_endpoints[tag_c]
+            if len(endpts) == 2:
+                for pt in endpts:
+                    if pt not in seen:
+                        seen.add(pt)
+                        corner_points.append(pt)
+
+        # Apply curve transfinite; the surface itself is set exactly once below
+        set_transfinite(radial_curves, curved_curves, [], n_div_radial, n_div_curved, bumpcoef)
 
         # Apply surface transfinite arrangement and corner tags
         if len(corner_points) == 3:
+            corners = np.asarray(corner_points)
             if 1 in corner_points:
-                i = corner_points.index(1)
-                corner_points = corner_points[i:] + corner_points[:i]
-                gmsh.model.geo.mesh.setTransfiniteSurface(
-                    s_tag, arrangement=use_arr, cornerTags=corner_points
+                i = int(np.flatnonzero(corners == 1)[0])
+                setTransfiniteSurface(
+                    s_tag, arrangement=use_arr, cornerTags=np.roll(corners, -i).tolist()
                 )
             else:
-                _, missing = find_missing_numbers(corner_points, np.arange(2, 21))
-                i = corner_points.index(missing[0])
-                corner_points = corner_points[i:] + corner_points[:i]
-                gmsh.model.geo.mesh.setTransfiniteSurface(s_tag, cornerTags=corner_points)
+                # Start from the corner that is not one of the profile points
+                missing = np.setdiff1d(corners, np.arange(2, 21))
+                i = int(np.flatnonzero(corners == missing[0])[0])
+                setTransfiniteSurface(s_tag, cornerTags=np.roll(corners, -i).tolist())
         else:
-            gmsh.model.geo.mesh.setTransfiniteSurface(s_tag, arrangement=use_arr)
+            # Four corners: the arrangement alone fixes the pattern
+            setTransfiniteSurface(s_tag, arrangement=use_arr)
 
 
 def create_wedge_volumes(
@@ -169,72 +294,53 @@ def create_wedge_volumes(
     n_div_radial: int,
     n_div_curved: int,
     bumpcoef: float,
-) -> (Sequence[Optional[int]], Sequence[Optional[int]]):
+    curve_ranges: Optional[Sequence[list]] = None,
+) -> (np.ndarray, np.ndarray):
     """
     Create inner and outer wedge volumes by revolving band and bulk surfaces.
+
+    `curve_ranges` optionally lists the types of the profile curves, as
+    recorded by `track_curve`.
+
+    Returns
+    -------
+    (inner_vols, outer_vols) : Tuple[np.ndarray, np.ndarray]
+        int32 arrays of volume tags ordered (band plus, band minus, bulk plus,
+        bulk minus). Bulk entries are -1 when the corresponding bulk surface
+        is None, so valid tags are selected with `vols[vols > 0]`. The model
+        is synchronized on return.
     """
     ensure_gmsh_available()
 
-    # Band volumes (transfinite)
-    vol_i_plus, vol_i_minus = revolve_surface(
-        revolve_axis,
-        revolve_center,
-        angle_sweep,
-        inner_surf,
-        n_div_radial,
-        n_div_curved,
-        bumpcoef,
-        "inner",
-        True,
-    )
-    gmsh.model.geo.synchronize()
-    vol_o_plus, vol_o_minus = revolve_surface(
-        revolve_axis,
-        revolve_center,
-        angle_sweep,
-        outer_surf,
-        n_div_radial,
-        n_div_curved,
-        bumpcoef,
-        "outer",
-        True,
-    )
-    gmsh.model.geo.synchronize()
+    inner_vols = np.full(4, -1, dtype=np.int32)
+    outer_vols = np.full(4, -1, dtype=np.int32)
 
-    # Bulk volumes (unstructured)
+    # (surface, surface_type, volume array, slot); band surfaces fill slots
+    # 0-1 and are transfinite, bulk surfaces fill slots 2-3 and are not.
+    wedge = [(inner_surf, "inner", inner_vols, 0), (outer_surf, "outer", outer_vols, 0)]
     if inner_bulk_surf is not None:
-        vol_ib_plus, vol_ib_minus = revolve_surface(
-            revolve_axis,
-            revolve_center,
-            angle_sweep,
-            inner_bulk_surf,
-            n_div_radial,
-            n_div_curved,
-            bumpcoef,
-            "inner",
-            False,
-        )
-        gmsh.model.geo.synchronize()
-    else:
-        vol_ib_plus = vol_ib_minus = None
-
+        wedge.append((inner_bulk_surf, "inner", inner_vols, 2))
     if outer_bulk_surf is not None:
-        vol_ob_plus, vol_ob_minus = revolve_surface(
-            revolve_axis,
-            revolve_center,
-            angle_sweep,
-            outer_bulk_surf,
-            n_div_radial,
-            n_div_curved,
-            bumpcoef,
-            "outer",
-            False,
-        )
-    else:
-        vol_ob_plus = vol_ob_minus = None
+        wedge.append((outer_bulk_surf, "outer", outer_vols, 2))
+
+    # Revolve the whole wedge profile at once in each direction
+    surfaces = [surf for (surf, _, _, _) in wedge]
+    blocks_plus = _revolve_batch(surfaces, revolve_axis, revolve_center, +angle_sweep)
+    blocks_minus = _revolve_batch(surfaces, revolve_axis, revolve_center, -angle_sweep)
+
+    # Transfinite settings need a synchronized model; collect the band sweeps
+    # and process them after a single synchronize once all revolves are done.
+    pending = []
+    for (_, surface_type, vols, slot), out_plus, out_minus in zip(wedge, blocks_plus, blocks_minus):
+        vols[slot] = out_plus[1][1]
+        vols[slot + 1] = out_minus[1][1]
+        if slot == 0:
+            pending += [(out_plus, surface_type), (out_minus, surface_type)]
+
+    gmsh.model.geo.synchronize()
+    _apply_transfinite_sweeps(pending, n_div_radial, n_div_curved, bumpcoef, curve_ranges)
 
+    # Hand back a fully synchronized model, including the transfinite constraints
     gmsh.model.geo.synchronize()
 
-    inner_vols = [vol_i_plus, vol_i_minus, vol_ib_plus, vol_ib_minus]
-    outer_vols = [vol_o_plus, vol_o_minus, vol_ob_plus, vol_ob_minus]
     return inner_vols, outer_vols
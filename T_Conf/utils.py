@@ -6,6 +6,7 @@ package, such as checking for missing indices in sets and ensuring that the
 Gmsh Python API is available before attempting mesh operations.
 """
 
+import functools
 from typing import Sequence, Tuple, List
 
 
@@ -40,12 +41,15 @@ def find_missing_numbers(lst: Sequence[int], arr: Sequence[int]) -> Tuple[bool,
     return bool(missing), missing
 
 
+@functools.lru_cache(maxsize=1)
 def ensure_gmsh_available() -> None:
     """
     Verify that the Gmsh Python API is importable and that libGLU is present.
     Raises a RuntimeError if it is not available.
 
     This should be called at the start of any operation that requires Gmsh.
+    A successful check is cached for the lifetime of the process; a failed
+    one is retried on the next call.
 
     Raises
     ------